@@ -7,6 +7,9 @@ REM Command file for Sphinx documentation
 if "%SPHINXBUILD%" == "" (
 	set SPHINXBUILD=sphinx-build
 )
+if "%SPHINXOPTS%" == "" (
+	set SPHINXOPTS=-j auto
+)
 set SOURCEDIR=source
 set BUILDDIR=_build
 set LINKCHECKDIR=\%BUILDDIR%\linkcheck
@@ -34,7 +37,7 @@ if errorlevel 9009 (
 goto end
 
 :html-noplot
-%SPHINXBUILD% -D plot_gallery=0 -b html %SOURCEDIR% %BUILDDIR%/html %SPHINXOPTS% %O%
+%SPHINXBUILD% -D plot_gallery=0 -b html -d %BUILDDIR%/doctrees %SOURCEDIR% %BUILDDIR%/html %SPHINXOPTS% %O%
 goto end
 
 :clean
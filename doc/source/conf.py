@@ -8,12 +8,16 @@
 
 # -- Path setup --------------------------------------------------------------
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import functools
+import json
 import os
+import pathlib
+import re
 import warnings
 
 from ansys_sphinx_theme import ansys_favicon, get_version_match
-from sphinx_gallery.sorting import FileNameSortKey
 
 import ansys.mechanical.core as pymechanical
 from ansys.mechanical.core.embedding.initializer import SUPPORTED_MECHANICAL_EMBEDDING_VERSIONS
@@ -38,6 +42,7 @@ project = "ansys.mechanical.core"
 copyright = f"(c) {datetime.now().year} ANSYS, Inc. All rights reserved"
 author = "ANSYS Inc."
 release = version = pymechanical.__version__
+switcher_version = get_version_match(version)
 cname = os.getenv("DOCUMENTATION_CNAME", default="mechanical.docs.pyansys.com")
 
 
@@ -76,6 +81,132 @@ intersphinx_mapping = {
     "pypim": ("https://pypim.docs.pyansys.com/version/dev/", None),
 }
 
+# Sphinx fetches the inventories above concurrently in a thread pool; bound each
+# fetch so a single slow host cannot stall the whole build.
+intersphinx_timeout = 10
+
+
+@functools.lru_cache(maxsize=None)
+def intersphinx_pymechanical(switcher_version: str) -> str:
+    """Get the intersphinx mapping URL for a given version of the PyMechanical documentation.
+
+    A cheap ``HEAD`` request is used to probe for ``objects.inv`` so the inventory
+    payload is not downloaded, and the result is cached so each version is only
+    probed once per build.
+
+    Parameters
+    ----------
+    switcher_version : str
+        Version of the PyMechanical documentation to link against.
+
+    Returns
+    -------
+    str
+        URL of the documentation for that version, falling back to the "dev"
+        documentation when the versioned inventory is not published. An empty
+        string is returned if no inventory could be found or the probe failed.
+    """
+    import requests
+
+    prefix = "https://mechanical.docs.pyansys.com/version"
+    candidates = [switcher_version] if switcher_version == "dev" else [switcher_version, "dev"]
+    for candidate in candidates:
+        url = f"{prefix}/{candidate}"
+        try:
+            response = requests.head(f"{url}/objects.inv", allow_redirects=True, timeout=10)
+        except requests.RequestException:
+            break
+        if response.status_code < 400:
+            return url
+    return ""
+
+
+# Directory holding inventories downloaded by previous builds, so cleared build
+# directories and offline builds do not have to re-download every objects.inv.
+INV_CACHE_DIR = pathlib.Path(__file__).parent / "_build" / ".inv_cache"
+
+
+def _cached_inventory(name: str, url: str) -> str:
+    """Fetch ``objects.inv`` for ``url`` through the on-disk inventory cache.
+
+    A conditional GET is issued with the ``ETag``/``Last-Modified`` headers saved
+    from the previous download, so unchanged inventories are answered with a
+    cheap 304 and the cached copy is reused. When the network is unavailable,
+    the cached copy (if any) is used as-is.
+
+    Parameters
+    ----------
+    name : str
+        Name of the intersphinx mapping entry, used as the cache key.
+    url : str
+        Base URL of the remote documentation.
+
+    Returns
+    -------
+    str
+        Path to the cached inventory file, or an empty string if it could not
+        be fetched or found in the cache.
+    """
+    import requests
+
+    inv_file = INV_CACHE_DIR / f"{name}.inv"
+    meta_file = INV_CACHE_DIR / f"{name}.json"
+    headers = {}
+    if inv_file.exists() and meta_file.exists():
+        meta = json.loads(meta_file.read_text())
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last-modified"):
+            headers["If-Modified-Since"] = meta["last-modified"]
+    try:
+        response = requests.get(f"{url.rstrip('/')}/objects.inv", headers=headers, timeout=10)
+    except requests.RequestException:
+        response = None
+    if response is not None and response.status_code == 200:
+        inv_file.write_bytes(response.content)
+        meta_file.write_text(
+            json.dumps(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last-modified": response.headers.get("Last-Modified"),
+                }
+            )
+        )
+        return str(inv_file)
+    # 304 Not Modified, an HTTP error, or no network: fall back to the cache.
+    return str(inv_file) if inv_file.exists() else ""
+
+
+def _resolve_intersphinx_inventories(app, config):
+    """Resolve the intersphinx mapping once Sphinx has read the configuration.
+
+    All network probes are deferred to this ``config-inited`` handler so that
+    importing ``conf.py`` (for example on sphinx-autobuild reloads or from
+    tooling) never blocks on HTTP requests.
+    """
+    mapping = config.intersphinx_mapping
+    pymechanical_inv_url = intersphinx_pymechanical(switcher_version)
+    if pymechanical_inv_url:
+        mapping["ansys.mechanical.core"] = (pymechanical_inv_url, None)
+    INV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(mapping)) as pool:
+        local_invs = list(
+            pool.map(
+                lambda item: (item[0], _cached_inventory(item[0], item[1][0])),
+                [(name, target) for name, target in mapping.items() if target[1] is None],
+            )
+        )
+    for name, local_inv in local_invs:
+        if local_inv:
+            mapping[name] = (mapping[name][0], local_inv)
+
+
+def setup(app):
+    """Connect the deferred intersphinx resolution and declare parallel safety."""
+    app.connect("config-inited", _resolve_intersphinx_inventories)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
+
+
 suppress_warnings = ["label.*", "autoapi.python_import_resolution", "design.grid", "config.cache"]
 # supress_warnings = ["ref.option"]
 
@@ -138,13 +269,24 @@ exclude_patterns = [
     "links.rst",
 ]
 
+
+@functools.lru_cache(maxsize=None)
+def _read_links(path: str, mtime: float) -> str:
+    """Read the link targets file, cached on its modification time.
+
+    Keying the cache on the mtime means repeated configuration reloads (for
+    example from sphinx-autobuild) skip the read until the file changes.
+    """
+    with open(path) as f:
+        return f.read()
+
+
 # make rst_epilog a variable, so you can add other epilog parts to it
-rst_epilog = ""
 # Read link all targets from file
-with open("links.rst") as f:
-    rst_epilog += f.read()
+_links_path = pathlib.Path(__file__).parent / "links.rst"
+rst_epilog = _read_links(str(_links_path), _links_path.stat().st_mtime)
 
-current_mechanical_version = next(iter(SUPPORTED_MECHANICAL_EMBEDDING_VERSIONS.keys()))
+current_mechanical_version = max(SUPPORTED_MECHANICAL_EMBEDDING_VERSIONS)
 rst_epilog = rst_epilog.replace("%%VERSION%%", f"v{current_mechanical_version}")
 # The name of the Pygments (syntax highlighting) style to use.
 pygments_style = "sphinx"
@@ -154,13 +296,20 @@ todo_include_todos = False
 
 # Copy button customization ---------------------------------------------------
 # exclude traditional Python prompts from the copied code
-copybutton_prompt_text = r">>> ?|\.\.\. "
+# The pattern itself is consumed by sphinx-copybutton's JavaScript; compiling it
+# here validates the regex once at configuration load instead of at build time.
+_COPYBUTTON_PROMPT = re.compile(r">>> ?|\.\.\. ")
+copybutton_prompt_text = _COPYBUTTON_PROMPT.pattern
 copybutton_prompt_is_regexp = True
 
 # -- Sphinx Gallery Options ---------------------------------------------------
 sphinx_gallery_conf = {
     # convert rst to md for ipynb
+    # Conversion only runs for stale examples: sphinx-gallery md5-hashes each
+    # example and skips regeneration (and hence pypandoc) for unchanged ones.
     "pypandoc": True,
+    # Never re-execute unchanged examples, so incremental builds stay cheap.
+    "run_stale_examples": False,
     # path to your examples scripts
     "examples_dirs": ["../../examples/"],
     # path where to save gallery generated examples
@@ -170,7 +319,7 @@ sphinx_gallery_conf = {
     # Remove the "Download all examples" button from the top level gallery
     "download_all_examples": False,
     # Sort gallery example by file name instead of number of lines (default)
-    "within_subsection_order": FileNameSortKey,
+    "within_subsection_order": "FileNameSortKey",
     # directory where function granular galleries are stored
     "backreferences_dir": None,
     # Modules for which function level galleries are created.  In
@@ -193,7 +342,7 @@ html_theme_options = {
     "logo": "pyansys",
     "switcher": {
         "json_url": f"https://{cname}/versions.json",
-        "version_match": get_version_match(version),
+        "version_match": switcher_version,
     },
     "check_switcher": False,
     "github_url": "https://github.com/ansys/pymechanical",
@@ -318,11 +467,14 @@ linkcheck_ignore = [
     "path.html",
 ]
 
+# Intersphinx already resolves references into these documentation sets, so
+# linkcheck does not need to probe the same hosts again.
+linkcheck_ignore.extend(f"{url.rstrip('/')}/.*" for url, _ in intersphinx_mapping.values())
+
 linkcheck_anchors = False
 
 # If we are on a release, we have to ignore the "release" URLs, since it is not
 # available until the release is published.
-switcher_version = get_version_match(version)
 if switcher_version != "dev":
     linkcheck_ignore.append(
         f"https://github.com/ansys/pymechanical/releases/tag/v{pymechanical.__version__}"
@@ -27,6 +27,8 @@ import os
 class AddinConfiguration:
     """Configuration class for Mechanical."""
 
+    __slots__ = ("_no_act_addins", "_addin_configuration")
+
     def __init__(self, addin_configuration: str = "Mechanical", **kwargs):
         """Construct a new Configuration instance."""
         # by default, disable ACT addins on linux
@@ -77,11 +77,16 @@ class UniqueUserProfile:
         """Set environment variables for new user profile."""
         home = self.location
         if "win" in sys.platform:
-            env["USERPROFILE"] = home
-            env["APPDATA"] = os.path.join(home, "AppData/Roaming")
-            env["LOCALAPPDATA"] = os.path.join(home, "AppData/Local")
-            env["TMP"] = os.path.join(home, "AppData/Local/Temp")
-            env["TEMP"] = os.path.join(home, "AppData/Local/Temp")
+            temp = os.path.join(home, "AppData/Local/Temp")
+            env.update(
+                {
+                    "USERPROFILE": home,
+                    "APPDATA": os.path.join(home, "AppData/Roaming"),
+                    "LOCALAPPDATA": os.path.join(home, "AppData/Local"),
+                    "TMP": temp,
+                    "TEMP": temp,
+                }
+            )
         elif "lin" in sys.platform:
             env["HOME"] = home
 
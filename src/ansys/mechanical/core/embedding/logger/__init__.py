@@ -48,23 +48,27 @@ Then, the :class:`Logger <ansys.mechanical.core.embedding.logger.Logger>` class
 
 """
 
+from collections.abc import Iterator
 import logging
 import os
-import typing
 
 from ansys.mechanical.core.embedding import initializer
 from ansys.mechanical.core.embedding.logger import environ, linux_api, sinks, windows_api
 
-LOGGING_SINKS: typing.Set[int] = set()
-"""Constant for logging sinks."""
+LOGGING_SINKS: int = 0
+"""Bitmask of enabled logging sinks, with bit ``n`` set for sink ID ``n``."""
 
 LOGGING_CONTEXT: str = "PYMECHANICAL"
 """Constant for logging context."""
 
+_ENVIRON_BACKEND: environ.EnvironBackend | None = None
+"""Cached environment variable backend."""
 
-def _get_backend() -> (
-    typing.Union[windows_api.APIBackend, linux_api.APIBackend, environ.EnvironBackend]
-):
+_API_BACKEND: windows_api.APIBackend | linux_api.APIBackend | None = None
+"""Cached Mechanical API backend."""
+
+
+def _get_backend() -> windows_api.APIBackend | linux_api.APIBackend | environ.EnvironBackend:
     """Get the appropriate logger backend.
 
     Before embedding is initialized, logging is configured via environment variables.
@@ -76,14 +80,23 @@ def _get_backend() -> (
 
     Setting the base directory only works before initializing.
     Actually logging a message or flushing the log only works after initializing.
+
+    The backends are stateless, so one instance of each is cached instead of
+    constructing a new object for every log call.
     """
     # TODO - use abc instead of a union type?
+    global _ENVIRON_BACKEND, _API_BACKEND
     embedding_initialized = initializer.INITIALIZED_VERSION is not None
     if not embedding_initialized:
-        return environ.EnvironBackend()
-    if os.name == "nt":
-        return windows_api.APIBackend()
-    return linux_api.APIBackend()
+        if _ENVIRON_BACKEND is None:
+            _ENVIRON_BACKEND = environ.EnvironBackend()
+        return _ENVIRON_BACKEND
+    if _API_BACKEND is None:
+        if os.name == "nt":
+            _API_BACKEND = windows_api.APIBackend()
+        else:
+            _API_BACKEND = linux_api.APIBackend()
+    return _API_BACKEND
 
 
 class Configuration:
@@ -137,7 +150,7 @@ class Configuration:
     @classmethod
     def set_log_level(cls, level: int) -> None:
         """Set the log level for all configured sinks."""
-        if len(LOGGING_SINKS) == 0:
+        if LOGGING_SINKS == 0:
             raise Exception("No logging backend configured!")
         cls._commit_level_configuration(level)
 
@@ -155,65 +168,114 @@ class Configuration:
             return
         _get_backend().set_base_directory(directory)
 
+    @staticmethod
+    def _enabled_sinks() -> Iterator[int]:
+        """Iterate over the sink IDs enabled in the ``LOGGING_SINKS`` bitmask.
+
+        The lowest set bit is peeled off with ``mask & -mask`` until the mask
+        is exhausted, so only enabled sinks are visited.
+        """
+        mask = LOGGING_SINKS
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
     @classmethod
     def _commit_level_configuration(cls, level: int) -> None:
-        for sink in LOGGING_SINKS:
+        for sink in cls._enabled_sinks():
             _get_backend().set_log_level(level, sink)
 
     @classmethod
     def _commit_enabled_configuration(cls) -> None:
-        for sink in LOGGING_SINKS:
+        for sink in cls._enabled_sinks():
             _get_backend().enable(sink)
 
     @classmethod
-    def _store_stdout_sink_enabled(cls, value: bool) -> None:
+    def _store_sink_enabled(cls, sink: int, value: bool) -> None:
+        global LOGGING_SINKS
         if value:
-            LOGGING_SINKS.add(sinks.StandardSinks.CONSOLE)
+            LOGGING_SINKS |= 1 << sink
         else:
-            LOGGING_SINKS.discard(sinks.StandardSinks.CONSOLE)
+            LOGGING_SINKS &= ~(1 << sink)
+
+    @classmethod
+    def _store_stdout_sink_enabled(cls, value: bool) -> None:
+        cls._store_sink_enabled(sinks.StandardSinks.CONSOLE, value)
 
     @classmethod
     def _store_file_sink_enabled(cls, value: bool) -> None:
-        if value:
-            LOGGING_SINKS.add(sinks.StandardSinks.STANDARD_LOG_FILE)
-        else:
-            LOGGING_SINKS.discard(sinks.StandardSinks.STANDARD_LOG_FILE)
+        cls._store_sink_enabled(sinks.StandardSinks.STANDARD_LOG_FILE, value)
 
 
-class Logger:
-    """Provides the ``Logger`` class for embedding."""
+def _log_message(level: int, msg: str, _context: str = LOGGING_CONTEXT) -> None:
+    """Log a message, skipping the API call when the level is filtered out.
 
-    @classmethod
-    def flush(cls):
-        """Flush the log."""
-        _get_backend().flush()
+    Once embedding is initialized, checking ``can_log_message`` first avoids
+    marshalling the context and message strings into the Mechanical logging
+    API for messages that would be discarded. Before initialization the
+    backend is called unconditionally, so logging a message still raises
+    regardless of the level. The context string is pre-bound as a default
+    argument so it is resolved once at function definition instead of on
+    every call.
+    """
+    backend = _get_backend()
+    if initializer.INITIALIZED_VERSION is not None and not backend.can_log_message(level):
+        return
+    backend.log_message(level, _context, msg)
 
-    @classmethod
-    def can_log_message(cls, level: int) -> bool:
-        """Get whether a message at this level is logged."""
-        return _get_backend().can_log_message(level)
 
-    @classmethod
-    def debug(cls, msg: str):
-        """Write a debug message to the log."""
-        _get_backend().log_message(logging.DEBUG, LOGGING_CONTEXT, msg)
+def flush():
+    """Flush the log."""
+    _get_backend().flush()
 
-    @classmethod
-    def error(cls, msg: str):
-        """Write a error message to the log."""
-        _get_backend().log_message(logging.ERROR, LOGGING_CONTEXT, msg)
 
-    @classmethod
-    def info(cls, msg: str):
-        """Write an info message to the log."""
-        _get_backend().log_message(logging.INFO, LOGGING_CONTEXT, msg)
+def can_log_message(level: int) -> bool:
+    """Get whether a message at this level is logged."""
+    return _get_backend().can_log_message(level)
 
-    @classmethod
-    def warning(cls, msg: str):
-        """Write a warning message to the log."""
-        _get_backend().log_message(logging.WARNING, LOGGING_CONTEXT, msg)
 
-    @classmethod
-    def fatal(cls, msg: str):
-        """Write a fatal message to the log."""
-        _get_backend().log_message(logging.FATAL, LOGGING_CONTEXT, msg)
+# The logging level constants are pre-bound as default arguments so the
+# module attribute lookups happen once at function definition, not per call.
+
+
+def debug(msg: str, _level: int = logging.DEBUG):
+    """Write a debug message to the log."""
+    _log_message(_level, msg)
+
+
+def error(msg: str, _level: int = logging.ERROR):
+    """Write a error message to the log."""
+    _log_message(_level, msg)
+
+
+def info(msg: str, _level: int = logging.INFO):
+    """Write an info message to the log."""
+    _log_message(_level, msg)
+
+
+def warning(msg: str, _level: int = logging.WARNING):
+    """Write a warning message to the log."""
+    _log_message(_level, msg)
+
+
+def fatal(msg: str, _level: int = logging.FATAL):
+    """Write a fatal message to the log."""
+    _log_message(_level, msg)
+
+
+class Logger:
+    """Provides the ``Logger`` class for embedding.
+
+    The actual logging entry points are plain module-level functions; they are
+    exposed here as static methods so ``Logger.info(...)`` keeps working
+    without the classmethod binding overhead on every call.
+    """
+
+    flush = staticmethod(flush)
+    can_log_message = staticmethod(can_log_message)
+    debug = staticmethod(debug)
+    error = staticmethod(error)
+    info = staticmethod(info)
+    warning = staticmethod(warning)
+    fatal = staticmethod(fatal)
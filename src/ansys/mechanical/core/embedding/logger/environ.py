@@ -28,6 +28,16 @@ import os
 from ansys.mechanical.core.embedding.logger import sinks
 
 
+def _set_env(key: str, value: str) -> None:
+    """Write an environment variable, skipping the write when it is unchanged.
+
+    Every assignment to ``os.environ`` calls ``putenv`` under the hood, so
+    re-writing an identical value on each configure is wasted work.
+    """
+    if os.environ.get(key) != value:
+        os.environ[key] = value
+
+
 class EnvironBackend:
     """Provides the environment variable backend for Mechanical logging."""
 
@@ -37,29 +47,29 @@ class EnvironBackend:
 
     def enable(self, sink: int = sinks.StandardSinks.CONSOLE):
         """Enable the given sink."""
-        os.environ["ANSYS_WORKBENCH_LOGGING"] = "1"
+        _set_env("ANSYS_WORKBENCH_LOGGING", "1")
         if sink == sinks.StandardSinks.CONSOLE:
-            os.environ["ANSYS_WORKBENCH_LOGGING_CONSOLE"] = "1"
+            _set_env("ANSYS_WORKBENCH_LOGGING_CONSOLE", "1")
         elif sink == sinks.StandardSinks.WINDOWS_DEBUGGER:
-            os.environ["ANSYS_WORKBENCH_LOGGING_DEBUGGER"] = "1"
+            _set_env("ANSYS_WORKBENCH_LOGGING_DEBUGGER", "1")
         elif sink == sinks.StandardSinks.WINDOWS_ERROR_MESSAGE_BOX:
-            os.environ["ANSYS_WORKBENCH_LOGGING_ERROR_MESSAGE_BOX"] = "1"
+            _set_env("ANSYS_WORKBENCH_LOGGING_ERROR_MESSAGE_BOX", "1")
         elif sink == sinks.StandardSinks.WINDOWS_FATAL_MESSAGE_BOX:
-            os.environ["ANSYS_WORKBENCH_LOGGING_FATAL_MESSAGE_BOX"] = "1"
+            _set_env("ANSYS_WORKBENCH_LOGGING_FATAL_MESSAGE_BOX", "1")
 
     def disable(self, sink: int = sinks.StandardSinks.CONSOLE):
         """Disable the log level for this sink."""
         if sink == sinks.StandardSinks.CONSOLE:
-            os.environ["ANSYS_WORKBENCH_LOGGING_CONSOLE"] = "0"
+            _set_env("ANSYS_WORKBENCH_LOGGING_CONSOLE", "0")
         elif sink == sinks.StandardSinks.WINDOWS_DEBUGGER:
-            os.environ["ANSYS_WORKBENCH_LOGGING_DEBUGGER"] = "0"
+            _set_env("ANSYS_WORKBENCH_LOGGING_DEBUGGER", "0")
         elif sink == sinks.StandardSinks.WINDOWS_ERROR_MESSAGE_BOX:
-            os.environ["ANSYS_WORKBENCH_LOGGING_ERROR_MESSAGE_BOX"] = "0"
+            _set_env("ANSYS_WORKBENCH_LOGGING_ERROR_MESSAGE_BOX", "0")
         elif sink == sinks.StandardSinks.WINDOWS_FATAL_MESSAGE_BOX:
-            os.environ["ANSYS_WORKBENCH_LOGGING_FATAL_MESSAGE_BOX"] = "0"
+            _set_env("ANSYS_WORKBENCH_LOGGING_FATAL_MESSAGE_BOX", "0")
         else:
             # only disable global logging if none of the sinks match?
-            os.environ["ANSYS_WORKBENCH_LOGGING"] = "0"
+            _set_env("ANSYS_WORKBENCH_LOGGING", "0")
 
     def set_log_level(self, level: int, sink: int = sinks.StandardSinks.CONSOLE):
         """Set the log level for this sink based on the Python log level."""
@@ -70,24 +80,24 @@ class EnvironBackend:
         if level <= logging.DEBUG:
             # level 0 in workbench logging is trace, level 1 is debug.
             # python logging.DEBUG will imply trace.
-            os.environ["ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL"] = "0"
+            _set_env("ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL", "0")
         elif level <= logging.INFO:
-            os.environ["ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL"] = "2"
+            _set_env("ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL", "2")
         elif level <= logging.WARNING:
-            os.environ["ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL"] = "3"
+            _set_env("ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL", "3")
         elif level <= logging.ERROR:
-            os.environ["ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL"] = "4"
+            _set_env("ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL", "4")
         elif level <= logging.CRITICAL:
-            os.environ["ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL"] = "5"
+            _set_env("ANSYS_WORKBENCH_LOGGING_FILTER_LEVEL", "5")
 
     def set_auto_flush(self, flush: bool) -> None:
         """Set whether to auto flush to the standard log file."""
         value = "1" if flush else "0"
-        os.environ["ANSYS_WORKBENCH_LOGGING_AUTO_FLUSH"] = value
+        _set_env("ANSYS_WORKBENCH_LOGGING_AUTO_FLUSH", value)
 
     def set_directory(self, directory: str) -> None:
         """Set the location to write the log file to."""
-        os.environ["ANSYS_WORKBENCH_LOGGING_DIRECTORY"] = directory
+        _set_env("ANSYS_WORKBENCH_LOGGING_DIRECTORY", directory)
 
     def set_base_directory(self, base_directory: str) -> None:
         """Set the base location to write the log file to.
@@ -96,7 +106,7 @@ class EnvironBackend:
         is actually written to. If a base directory is set, it takes precedence over the
         ``set_directory`` location.
         """
-        os.environ["ANSYS_WORKBENCH_LOGGING_BASE_DIRECTORY"] = base_directory
+        _set_env("ANSYS_WORKBENCH_LOGGING_BASE_DIRECTORY", base_directory)
 
     def can_log_message(self, level: int) -> bool:
         """Return whether a message with the given severity is outputted to the log."""
@@ -22,12 +22,27 @@
 
 """Runtime initialize for pythonnet in embedding."""
 
+import functools
 from importlib.metadata import distribution
 import os
 
 from ansys.mechanical.core.embedding.logger import Logger
 
 
+@functools.lru_cache(maxsize=1)
+def _is_pythonnet_installed() -> bool:
+    """Get whether the vanilla pythonnet package is installed.
+
+    The result is memoized because probing the distribution metadata scans the
+    filesystem, and the answer cannot change within a process.
+    """
+    try:
+        distribution("pythonnet")
+        return True
+    except ModuleNotFoundError:
+        return False
+
+
 def __register_container_codecs():
     import Python.Runtime.Codecs as codecs
 
@@ -48,11 +63,8 @@ def __register_function_codec():
 def _bind_assembly_for_explicit_interface(assembly_name: str):
     """Bind the assembly for explicit interface implementation."""
     # if pythonnet is not installed, we can't bind the assembly
-    try:
-        distribution("pythonnet")
+    if _is_pythonnet_installed():
         return
-    except ModuleNotFoundError:
-        pass
 
     import clr
 
@@ -28,7 +28,6 @@ from pathlib import Path
 from subprocess import Popen  # nosec: B404
 import sys
 import tempfile
-import typing
 
 
 class UILauncher:
@@ -48,9 +47,7 @@ class UILauncher:
         """
         app.save()
 
-    def save_temp_copy(
-        self, app: "ansys.mechanical.core.embedding.App"
-    ) -> typing.Union[Path, Path]:
+    def save_temp_copy(self, app: "ansys.mechanical.core.embedding.App") -> tuple[Path, str]:
         """Save a new mechdb file with a temporary name.
 
         Parameters
@@ -89,7 +86,7 @@ class UILauncher:
 
     def graphically_launch_temp(
         self, app: "ansys.mechanical.core.embedding.App", temp_file: Path
-    ) -> typing.Union[Popen, str]:
+    ) -> Popen | str:
         """Launch the GUI for the mechdb file with a temporary name from save_temp_copy().
 
         Parameters
@@ -30,9 +30,10 @@ import site
 import sys
 import warnings
 
-import ansys.tools.path as atp
 import click
 
+from ansys.mechanical.core.misc import get_mechanical_path_and_version
+
 
 def get_stubs_location():
     """Find the ansys-mechanical-stubs installation location in site-packages.
@@ -214,8 +215,7 @@ def cli(ide: str, target: str, revision: int) -> None:
 
     """
     if not revision:
-        exe = atp.get_mechanical_path(allow_input=False, version=revision)
-        version = atp.version_from_path("mechanical", exe)
+        _, version = get_mechanical_path_and_version(revision)
     else:
         version = revision
 
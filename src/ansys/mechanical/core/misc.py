@@ -22,11 +22,36 @@
 
 """Contain miscellaneous functions and methods at the module level."""
 
-from functools import wraps
+from functools import lru_cache, wraps
 import os
 import socket
 from threading import Thread
 
+import ansys.tools.path as atp
+
+
+@lru_cache(maxsize=None)
+def get_mechanical_path_and_version(revision=None):
+    """Get the Mechanical executable path and version number for a revision.
+
+    The lookup scans the filesystem and its result cannot change within a
+    process, so it is memoized and shared by the CLI entry points.
+
+    Parameters
+    ----------
+    revision: int, optional
+        Ansys revision number, for example ``251``. The default is ``None``,
+        in which case the default from ansys-tools-path is used.
+
+    Returns
+    -------
+    tuple
+        The path to the Mechanical executable file and its version number.
+    """
+    exe = atp.get_mechanical_path(allow_input=False, version=revision)
+    version = atp.version_from_path("mechanical", exe)
+    return exe, version
+
 
 def is_windows():
     """Check if the host machine is on Windows.
@@ -22,10 +22,13 @@
 
 """Convenience CLI to run mechanical."""
 
-import asyncio
-from asyncio.subprocess import PIPE
 import os
+
+# Subprocess is needed to launch Mechanical and forward its output.
+# Excluding bandit check.
+import subprocess  # nosec: B404
 import sys
+import threading
 import typing
 import warnings
 
@@ -34,56 +37,67 @@ import click
 
 from ansys.mechanical.core.embedding.appdata import UniqueUserProfile
 from ansys.mechanical.core.feature_flags import get_command_line_arguments, get_feature_flag_names
+from ansys.mechanical.core.misc import get_mechanical_path_and_version
 
 DRY_RUN = False
 """Dry run constant."""
 
+_FORWARD_CHUNK_SIZE = 65536
+"""Number of bytes to read per chunk when forwarding the child's output."""
+
 # TODO - add logging options (reuse env var based logging initialization)
 # TODO - add timeout
 
 
-async def _read_and_display(cmd, env, do_display: bool):
+def _forward_stream(stream, buf: list, display, do_display: bool):
+    """Read from the child's pipe until EOF, saving and optionally displaying each chunk.
+
+    Forwarding does not need line boundaries, so the pipe is read in chunks:
+    whatever is available is passed through in one go instead of splitting and
+    re-joining the output line by line. ``read1`` returns as soon as any data
+    arrives, where ``read`` would block until the full chunk accumulates and
+    defer display of the child's output until it exits.
+    """
+    while True:
+        data = stream.read1(_FORWARD_CHUNK_SIZE)
+        if not data:  # EOF
+            break
+        buf.append(data)  # save for later
+        if do_display:
+            display.write(data)  # display in terminal
+            display.flush()
+
+
+def _read_and_display(cmd, env, do_display: bool):
     """Read command's stdout and stderr and display them as they are processed."""
     # start process
-    process = await asyncio.create_subprocess_exec(*cmd, stdout=PIPE, stderr=PIPE, env=env)
-    # read child's stdout/stderr concurrently
+    process = subprocess.Popen(  # nosec: B603
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env
+    )
+    # read child's stdout/stderr concurrently with one blocking reader thread per pipe
     stdout, stderr = [], []  # stderr, stdout buffers
-    tasks = {
-        asyncio.Task(process.stdout.readline()): (stdout, process.stdout, sys.stdout.buffer),
-        asyncio.Task(process.stderr.readline()): (stderr, process.stderr, sys.stderr.buffer),
-    }
-    while tasks:
-        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-        if not done:
-            raise RuntimeError("Subprocess read failed: No tasks completed.")
-        for future in done:
-            buf, stream, display = tasks.pop(future)
-            line = future.result()
-            if line:  # not EOF
-                buf.append(line)  # save for later
-                if do_display:
-                    display.write(line)  # display in terminal
-                # schedule to read the next line
-                tasks[asyncio.Task(stream.readline())] = buf, stream, display
+    readers = [
+        threading.Thread(
+            target=_forward_stream, args=(process.stdout, stdout, sys.stdout.buffer, do_display)
+        ),
+        threading.Thread(
+            target=_forward_stream, args=(process.stderr, stderr, sys.stderr.buffer, do_display)
+        ),
+    ]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
 
     # wait for the process to exit
-    rc = await process.wait()
+    rc = process.wait()
     return rc, process, b"".join(stdout), b"".join(stderr)
 
 
 def _run(args, env, check=False, display=False):
-    if os.name == "nt":
-        loop = asyncio.ProactorEventLoop()  # for subprocess' pipes on Windows
-        asyncio.set_event_loop(loop)
-    else:
-        loop = asyncio.get_event_loop()
-    try:
-        rc, process, *output = loop.run_until_complete(_read_and_display(args, env, display))
-        if rc and check:
-            sys.exit("child failed with '{}' exit code".format(rc))
-    finally:
-        if os.name == "nt":
-            loop.close()
+    rc, process, *output = _read_and_display(args, env, display)
+    if rc and check:
+        sys.exit("child failed with '{}' exit code".format(rc))
     return process, output
 
 
@@ -126,37 +140,6 @@ def _cli_impl(
     if (not graphical) and (input_script is None) and (not port):
         raise Exception("An input script, -i, or port, --port, are required in batch mode.")
 
-    args = [exe, "-DSApplet"]
-    if (not graphical) or (not show_welcome_screen):
-        args.append("-AppModeMech")
-
-    if version < 232:
-        args.append("-nosplash")
-        args.append("-notabctrl")
-
-    if not graphical:
-        args.append("-b")
-
-    env: typing.Dict[str, str] = os.environ.copy()
-    if debug:
-        env["WBDEBUG_STOP"] = "1"
-
-    if port:
-        args.append("-grpc")
-        args.append(str(port))
-
-    if project_file:
-        args.append("-file")
-        args.append(project_file)
-
-    if input_script:
-        args.append("-script")
-        args.append(input_script)
-
-    if script_args:
-        args.append("-ScriptArgs")
-        args.append(f'"{script_args}"')
-
     if (not graphical) and input_script:
         exit = True
         if version < 241:
@@ -166,8 +149,26 @@ def _cli_impl(
                 stacklevel=2,
             )
 
-    if exit and input_script and version >= 241:
-        args.append("-x")
+    args = [
+        exe,
+        "-DSApplet",
+        *(["-AppModeMech"] if (not graphical) or (not show_welcome_screen) else []),
+        *(["-nosplash", "-notabctrl"] if version < 232 else []),
+        *(["-b"] if not graphical else []),
+        *(["-grpc", str(port)] if port else []),
+        *(["-file", project_file] if project_file else []),
+        *(["-script", input_script] if input_script else []),
+        *(["-ScriptArgs", f'"{script_args}"'] if script_args else []),
+        *(["-x"] if exit and input_script and version >= 241 else []),
+    ]
+
+    # Only copy the environment when this launch has to modify it; otherwise
+    # the child simply inherits the current environment.
+    env: typing.Dict[str, str] = os.environ
+    if debug or private_appdata:
+        env = os.environ.copy()
+    if debug:
+        env["WBDEBUG_STOP"] = "1"
 
     profile: UniqueUserProfile = None
     if private_appdata:
@@ -193,6 +194,12 @@ def _cli_impl(
 
     if DRY_RUN:
         return args, env
+    elif port:
+        # Server mode runs until the server is shut down and nothing consumes
+        # the captured output, so skip the pipe forwarding and let the child
+        # write straight to the terminal.
+        process = subprocess.Popen(args, env=env)  # nosec: B603
+        process.wait()
     else:
         _run(args, env, False, True)
 
@@ -302,8 +309,7 @@ def cli(
 
         Starting Ansys Mechanical version 2025R1 in graphical mode...
     """
-    exe = atp.get_mechanical_path(allow_input=False, version=revision)
-    version = atp.version_from_path("mechanical", exe)
+    exe, version = get_mechanical_path_and_version(revision)
 
     return _cli_impl(
         project_file,
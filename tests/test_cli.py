@@ -24,6 +24,8 @@ import os
 from pathlib import Path
 import subprocess
 import sys
+import threading
+import time
 
 import ansys.tools.path as atp
 from click.testing import CliRunner
@@ -31,7 +33,7 @@ import pytest
 
 from ansys.mechanical.core.ide_config import cli as ideconfig_cli
 from ansys.mechanical.core.ide_config import get_stubs_location, get_stubs_versions
-from ansys.mechanical.core.run import _cli_impl
+from ansys.mechanical.core.run import _cli_impl, _forward_stream, _run
 
 STUBS_LOC = get_stubs_location()
 STUBS_REVNS = get_stubs_versions(STUBS_LOC)
@@ -270,6 +272,41 @@ def test_cli_batch_required_args(disable_cli):
         assert False, f"cli raised an exception: {e}"
 
 
+@pytest.mark.cli
+def test_run_forwards_output(capfdbinary):
+    """Test that _run captures the child's output and displays it."""
+    script = "import sys; print('to stdout'); print('to stderr', file=sys.stderr)"
+    process, output = _run([sys.executable, "-c", script], None, check=True, display=True)
+    assert process.returncode == 0
+    assert b"to stdout" in output[0]
+    assert b"to stderr" in output[1]
+    captured = capfdbinary.readouterr()
+    assert b"to stdout" in captured.out
+    assert b"to stderr" in captured.err
+
+
+@pytest.mark.cli
+def test_forward_stream_is_incremental():
+    """Test that output is forwarded as it arrives, not once a full chunk accumulates."""
+    read_fd, write_fd = os.pipe()
+    buf = []
+    reader = threading.Thread(
+        target=_forward_stream, args=(os.fdopen(read_fd, "rb"), buf, None, False)
+    )
+    reader.start()
+    try:
+        # A few bytes written while the pipe stays open must show up in the
+        # buffer without waiting for EOF.
+        os.write(write_fd, b"early")
+        deadline = time.time() + 10
+        while not buf and time.time() < deadline:
+            time.sleep(0.01)
+        assert buf == [b"early"]
+    finally:
+        os.close(write_fd)
+        reader.join()
+
+
 def get_settings_location() -> str:
     """Get the location of settings.json for user settings.
 